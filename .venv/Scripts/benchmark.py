@@ -0,0 +1,122 @@
+from typing import List, Callable, Tuple
+from pypdf import PdfReader
+import argparse
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+import toronto_street_search as tss
+
+def get_pdf_lines() -> List[str]:
+    """ Extract the raw lines of the street list pages of the PDF """
+    reader = PdfReader(tss.PDF_PATH)
+    lines = []
+    for i in tss.PDF_PAGES:
+        lines.extend(reader.pages[i].extract_text(extraction_mode='layout').split('\n'))
+    return lines
+
+def measure(function: Callable[[], object], repeat: int) -> float:
+    """ Return the best time in seconds out of [repeat] calls of function """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def bench_tokenizer(lines: List[str], repeat: int = 5) -> None:
+    """ Print how many lines per second the suffix tokenizer and the line cleaner get through """
+    lowered = [line.lower() for line in lines]
+    cases = {
+        'tokenize_street_suffixes': lambda: [tss.tokenize_street_suffixes(line) for line in lowered],
+        'get_street_type': lambda: [tss.get_street_type(line) for line in lowered],
+        'get_street_type_order': lambda: [tss.get_street_type_order(line) for line in lowered],
+        'clean_street_lines': lambda: list(tss.clean_street_lines(lines)),
+    }
+    print(f'Tokenizer throughput over {len(lines)} lines:')
+    for name, function in cases.items():
+        seconds = measure(function, repeat)
+        print(f'{name:<28}{len(lines) / seconds:>14,.0f} lines/s')
+
+def measure_memory(function: Callable[[], object]) -> int:
+    """ Return the peak memory in bytes allocated during a call of function """
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def make_synthetic_records(records: List[tss.StreetRecord], scale: int) -> List[tss.StreetRecord]:
+    """ Repeat records [scale] times, giving every copy after the first new street names """
+    synthetic = list(records)
+    for copy in range(1, scale):
+        for record in records:
+            words = record.name.split(' ')
+            words[0] += str(copy)
+            synthetic.append(record._replace(name=' '.join(words)))
+    return synthetic
+
+def load_records(records: List[tss.StreetRecord]) -> None:
+    """ Replace the loaded database with records and rebuild the indexes """
+    tss.clear_street_database()
+    for record in records:
+        tss.add_street_record(record)
+    tss.build_street_indexes()
+
+def bench_operations(records: List[tss.StreetRecord], scale: int, calls: int = 1000, repeat: int = 3) -> None:
+    """ Print the time per call and peak memory of the hot paths over records repeated [scale] times """
+    synthetic = make_synthetic_records(records, scale)
+    load_records(synthetic)
+    sorted_streets = sorted(tss.basic_streets, key=str.lower)
+    names = [random.choice(tss.basic_streets) for _ in range(calls)]
+    snapshot_path = os.path.join(tempfile.gettempdir(), 'benchmark.snapshot')
+    digest = bytes(32)
+    engine = tss.QuizEngine(0)
+
+    # (operation, number of calls made by function, function)
+    cases: List[Tuple[str, int, Callable[[], object]]] = [
+        ('load records + indexes', 1, lambda: load_records(synthetic)),
+        ('save_snapshot', 1, lambda: tss.save_snapshot(digest, snapshot_path)),
+        ('load_snapshot + indexes', 1, lambda: (tss.load_snapshot(digest, snapshot_path), tss.build_street_indexes())),
+        ('get_type', calls, lambda: [tss.get_type(name) for name in names]),
+        ('binary_search_str', calls, lambda: [tss.binary_search_str(name, sorted_streets) for name in names]),
+        ('get_streets_of_type', calls, lambda: [tss.get_streets_of_type('st', 10, shuffle=True) for _ in names]),
+        ('Question.__init__', calls, lambda: [tss.Question('street', 4) for _ in names]),
+        ('Quiz.__init__ (10 questions)', calls // 10, lambda: [tss.Quiz(10) for _ in range(calls // 10)]),
+        ('QuizEngine.question', calls, lambda: list(engine.questions(calls))),
+        ('QuizEngine question export', calls, lambda: [q.to_dict() for q in engine.questions(calls)]),
+    ]
+    print(f'\n{len(synthetic)} streets ({scale}x):')
+    print(f'{"Operation":<32}{"us/call":>12}{"peak KB":>12}')
+    for name, count, function in cases:
+        seconds = measure(function, repeat)
+        peak = measure_memory(function)
+        print(f'{name:<32}{seconds * 1e6 / count:>12.1f}{peak / 1024:>12.1f}')
+    os.remove(snapshot_path)
+
+def bench_pdf_parse(workers: int) -> None:
+    """ Print how long it takes to parse the bundled PDF """
+    seconds = measure(lambda: tss.parse_street_database(workers=workers), 1)
+    print(f'parse_street_database ({workers} workers): {seconds:.2f}s for {len(tss.basic_streets)} streets')
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark Toronto Street Search.')
+    parser.add_argument('--repeat', type=int, default=5, help='number of runs to take the best of')
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100],
+                        help='how many times to repeat the street list (default: 1 10 100)')
+    parser.add_argument('--calls', type=int, default=1000, help='calls per lookup operation')
+    parser.add_argument('--parse', action='store_true',
+                        help='also time parsing the PDF and the suffix tokenizer, which takes seconds')
+    parser.add_argument('--workers', type=int, default=1, help='processes used by --parse')
+    args = parser.parse_args()
+
+    random.seed(0)
+    if args.parse:
+        bench_pdf_parse(args.workers)
+        bench_tokenizer(get_pdf_lines(), args.repeat)
+    tss.get_basic_street_database()
+    bundled = [tss.detailed_streets.get_record(i) for i in range(len(tss.detailed_streets))]
+    for scale in args.scales:
+        bench_operations(bundled, scale, args.calls, args.repeat)
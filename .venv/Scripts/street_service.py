@@ -0,0 +1,196 @@
+from typing import Dict, Tuple, Callable, Any
+from collections import deque
+from urllib.parse import urlsplit, parse_qsl
+import argparse
+import asyncio
+import json
+import time
+import toronto_street_search as tss
+
+# Latencies kept per endpoint for the percentiles in /stats
+LATENCY_WINDOW = 10000
+MAX_BODY_SIZE = 1 << 20
+MAX_HEADERS = 100
+LOCAL_HOSTS = ('127.0.0.1', 'localhost', '::1')
+
+def get_int(params: Dict[str, Any], key: str, default: int) -> int:
+    value = params.get(key, default)
+    assert isinstance(value, int) or (isinstance(value, str) and value.isdigit()), f'{key} is not an integer'
+    return int(value)
+
+def handle_lookup(params: Dict[str, Any]) -> Dict[str, Any]:
+    """ Look up a street name, as get_type does """
+    name = params.get('name', '')
+    street, street_type, status = tss.lookup_street(name)
+    return {'name': name, 'street': street, 'type': street_type, 'status': status}
+
+def handle_autocomplete(params: Dict[str, Any]) -> Dict[str, Any]:
+    text = params.get('text', '')
+    return {'text': text, 'streets': tss.autocomplete_street(text, get_int(params, 'k', 10))}
+
+def handle_streets(params: Dict[str, Any]) -> Dict[str, Any]:
+    """ List streets of a type, as get_streets_of_type does """
+    type = params.get('type', '')
+    shuffle = str(params.get('shuffle', '')).lower() in ('1', 'true', 'yes')
+    return {'type': type, 'streets': tss.get_streets_of_type(type, get_int(params, 'amount', 4), shuffle)}
+
+def handle_types(params: Dict[str, Any]) -> Dict[str, Any]:
+    return {'counts': tss.get_street_type_counts()}
+
+def handle_question(params: Dict[str, Any]) -> Dict[str, Any]:
+    """ Generate a quiz question, the same one every time for the same seed """
+    seed = get_int(params, 'seed', 0) if 'seed' in params else None
+    num_of_ans = get_int(params, 'answers', 0) if 'answers' in params else None
+    question = tss.QuizEngine(seed).question(params.get('q_type'), num_of_ans)
+    return {'question': question.render_question(), 'street': question.get_street(),
+            'type': question.get_street_type(), 'answers': question.ordered_ans,
+            'correct_answer': question.get_correct_answer()}
+
+class StreetService:
+    """ JSON-over-HTTP service answering street lookups from the database loaded once by toronto_street_search """
+    def __init__(self):
+        self.endpoints: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+            '/lookup': handle_lookup,
+            '/autocomplete': handle_autocomplete,
+            '/streets': handle_streets,
+            '/types': handle_types,
+            '/question': handle_question,
+        }
+        self.latencies: Dict[str, deque] = {path: deque(maxlen=LATENCY_WINDOW)
+                                            for path in list(self.endpoints) + ['/batch']}
+        self.calls: Dict[str, int] = {path: 0 for path in self.latencies}
+        self.errors: Dict[str, int] = {path: 0 for path in self.latencies}
+
+    def call(self, path: str, params: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        """ Run one endpoint and return the HTTP status and the JSON response """
+        if path == '/stats':
+            return 200, self.get_stats()
+        if path not in self.latencies:
+            return 404, {'error': f'unknown endpoint \'{path}\''}
+        start = time.perf_counter()
+        try:
+            if path == '/batch':
+                status, response = 200, self.handle_batch(params)
+            else:
+                status, response = 200, self.endpoints[path](params)
+        except AssertionError as error:
+            status, response = 400, {'error': str(error)}
+        except Exception as error:
+            status, response = 500, {'error': f'{type(error).__name__}: {error}'}
+        # Failed calls are timed and counted too
+        self.latencies[path].append(time.perf_counter() - start)
+        self.calls[path] += 1
+        if status != 200:
+            self.errors[path] += 1
+        return status, response
+
+    def handle_batch(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """ Run a list of {"endpoint": ..., "params": {...}} requests and return their responses in order """
+        requests = params.get('requests')
+        assert isinstance(requests, list), 'requests is not a list'
+        results = []
+        for request in requests:
+            assert isinstance(request, dict) and request.get('endpoint') in self.endpoints, \
+                'each request needs a known endpoint'
+            status, response = self.call(request['endpoint'], request.get('params', {}))
+            results.append({'status': status, 'response': response})
+        return {'results': results}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Return the number of calls and errors, and the 50th/90th/99th percentile latencies (ms) over the last
+        LATENCY_WINDOW calls, of each endpoint
+        """
+        stats = {}
+        for path, latencies in self.latencies.items():
+            ordered = sorted(latencies)
+            stats[path] = {'calls': self.calls[path], 'errors': self.errors[path]}
+            for percentile in (50, 90, 99):
+                value = ordered[min(len(ordered) - 1, len(ordered) * percentile // 100)] if ordered else 0
+                stats[path][f'p{percentile}_ms'] = round(value * 1000, 3)
+        return stats
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """ Serve HTTP/1.1 requests on one connection until the client closes it """
+        try:
+            while True:
+                headers: Dict[str, str] = {}
+                try:
+                    request_line = await reader.readline()
+                    if not request_line:
+                        break
+                    for _ in range(MAX_HEADERS + 1):
+                        line = await reader.readline()
+                        if line in (b'\r\n', b'\n', b''):
+                            break
+                        key, _, value = line.decode('latin-1').partition(':')
+                        headers[key.strip().lower()] = value.strip()
+                    else:
+                        raise ValueError('too many header lines')
+                except ValueError:
+                    # readline raises ValueError on a line longer than the reader's limit (64 KiB)
+                    status, response, keep_alive = 431, {'error': 'request headers are too large'}, False
+                else:
+                    status, response, keep_alive = await self.handle_request(request_line, headers, reader)
+                body = json.dumps(response).encode('utf-8')
+                keep_alive = keep_alive and headers.get('connection', '').lower() != 'close'
+                writer.write(f'HTTP/1.1 {status} {"OK" if status == 200 else "Error"}\r\n'
+                             f'Content-Type: application/json\r\nContent-Length: {len(body)}\r\n'
+                             f'Connection: {"keep-alive" if keep_alive else "close"}\r\n\r\n'.encode('latin-1'))
+                writer.write(body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def handle_request(self, request_line: bytes, headers: Dict[str, str],
+                             reader: asyncio.StreamReader) -> Tuple[int, Dict[str, Any], bool]:
+        """
+        Read the body of a request and answer it. Returns the HTTP status, the JSON response and whether the
+        connection can be kept alive, which it cannot when the body was left unread.
+        """
+        parts = request_line.decode('latin-1').split()
+        if len(parts) != 3 or parts[0] not in ('GET', 'POST'):
+            return 405, {'error': 'only GET and POST are supported'}, False
+        length = headers.get('content-length', '0').strip() or '0'
+        if not length.isdigit():
+            return 400, {'error': 'Content-Length is not a non-negative integer'}, False
+        length = int(length)
+        if length > MAX_BODY_SIZE:
+            return 413, {'error': 'request body is too large'}, False
+        url = urlsplit(parts[1])
+        params: Dict[str, Any] = dict(parse_qsl(url.query))
+        if length > 0:
+            try:
+                body = json.loads(await reader.readexactly(length))
+            except ValueError:
+                return 400, {'error': 'request body is not JSON'}, True
+            if not isinstance(body, dict):
+                return 400, {'error': 'request body is not a JSON object'}, True
+            params.update(body)
+        status, response = self.call(url.path, params)
+        return status, response, True
+
+async def serve(host: str = '127.0.0.1', port: int = 8765) -> None:
+    assert host in LOCAL_HOSTS, 'the service only runs on localhost'
+    # The database and its indexes are loaded once and only read from then on, so every request shares them
+    tss.get_basic_street_database()
+    service = StreetService()
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    print(f'Serving Toronto Street Search on http://{host}:{port} ' +
+          f'({", ".join(list(service.endpoints) + ["/batch", "/stats"])})')
+    async with server:
+        await server.serve_forever()
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Serve Toronto Street Search lookups over HTTP on localhost.')
+    parser.add_argument('--host', default='127.0.0.1', choices=LOCAL_HOSTS, help='local address to listen on')
+    parser.add_argument('--port', type=int, default=8765, help='port to listen on')
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print('Stopping service...')
@@ -0,0 +1,1232 @@
+from abc import abstractmethod
+from typing import List, Tuple, Set, Dict, Optional, Iterable, Iterator, NamedTuple, TextIO, Any
+from pypdf import PdfReader
+import array
+import atexit
+import bisect
+import csv
+import functools
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+import re
+import time
+import struct
+import tempfile
+import argparse
+import sys
+import random
+
+# Opt-in profiling: set TSS_PROFILE=1 to time and count the hot paths and print a breakdown at exit
+PROFILING = os.environ.get('TSS_PROFILE', '') not in ('', '0')
+profile_stats: Dict[str, List[float]] = {} # Phase -> [calls, seconds]
+
+def profiled(function):
+    """ Time and count the calls of function when profiling, otherwise return it unchanged """
+    if not PROFILING:
+        return function
+    stats = profile_stats.setdefault(function.__qualname__, [0, 0.0])
+    depth = [0] # Only the outermost call of a recursive function is counted and timed
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if depth[0] > 0:
+            return function(*args, **kwargs)
+        stats[0] += 1
+        depth[0] += 1
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            stats[1] += time.perf_counter() - start
+            depth[0] -= 1
+    return wrapper
+
+def print_profile() -> None:
+    """ Print the calls and time spent in each profiled phase, slowest first """
+    print(f'{"Phase":<32}{"Calls":>10}{"Total ms":>12}{"us/call":>10}', file=sys.stderr)
+    for phase, (calls, seconds) in sorted(profile_stats.items(), key=lambda item: -item[1][1]):
+        if calls > 0:
+            print(f'{phase:<32}{calls:>10}{seconds * 1000:>12.1f}{seconds * 1e6 / calls:>10.1f}', file=sys.stderr)
+
+if PROFILING:
+    atexit.register(print_profile)
+
+class Street:
+    """ Template class for Street objects """
+    __slots__ = ('name', 'street_type', 'classification')
+
+    def __init__(self, full_name, classification):
+        self.name, self.street_type, _ = split_street_name(full_name)
+        self.classification = classification
+
+    def get_name(self):
+        return self.name
+
+    def get_street_type(self):
+        return self.street_type
+
+    def get_classification(self):
+        return self.classification
+
+    @abstractmethod
+    def __str__(self):
+        pass
+
+class SameFromAndToStreet (Street):
+    """ Template class for Streets with the same from and to streets (ends) """
+    __slots__ = ('ends',)
+
+    def __init__(self, full_name, ends, classification):
+        Street.__init__(self, full_name, classification)
+        self.ends = split_street_name(ends)[0]
+
+    def get_ends(self):
+        return self.ends
+
+    def __str__(self):
+        returned = "-" * 15
+        returned += f'Full name: {self.get_name()}\n'
+        returned += f'Ends: {self.get_ends()}\n'
+        returned += f'Classification: {self.get_classification()}\n'
+        returned += "-" * 15
+        return returned
+
+class DifferentFromAndToStreet (Street):
+    """ Template class for Streets with different from and to streets """
+    __slots__ = ('from_street', 'to_street')
+
+    def __init__(self, full_name, _from, _to, classification):
+        Street.__init__(self, full_name, classification)
+        self.from_street = split_street_name(_from)[0]
+        self.to_street = split_street_name(_to)[0]
+
+    def get_from_street(self):
+        return self.from_street
+
+    def get_to_street(self):
+        return self.to_street
+
+    def __str__(self):
+        returned = "-" * 15
+        returned += f'Full name: {self.get_name()}\n'
+        returned += f'From: {self.get_from_street()}\n'
+        returned += f'To: {self.get_to_street() or "Unknown"}\n'
+        returned += f'Classification: {self.get_classification()}\n'
+        returned += "-" * 15
+        return returned
+
+class StreetSearchIndex:
+    """ Exact, prefix and substring search over street names, built once with pre-lowercased keys """
+    def __init__(self, streets: List[str], types: List[str]):
+        names: Dict[str, str] = {}
+        self.types: Dict[str, str] = {} # Lowercase name -> street type
+        for i in range(len(streets)):
+            key = ' '.join(streets[i].lower().split())
+            if key not in names:
+                names[key] = streets[i]
+                self.types[key] = types[i]
+        self.keys: List[str] = sorted(names)
+        self.names: List[str] = [names[key] for key in self.keys]
+
+        # All keys joined into one string, so a substring search is a single str.find per match
+        self.text = '\n'.join(self.keys)
+        self.offsets: List[int] = []
+        offset = 0
+        for key in self.keys:
+            self.offsets.append(offset)
+            offset += len(key) + 1
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        return ' '.join(query.lower().split())
+
+    def exact(self, query: str) -> Optional[str]:
+        """ Return the street named [query], or None """
+        i = bisect.bisect_left(self.keys, self.normalize(query))
+        if i < len(self.keys) and self.keys[i] == self.normalize(query):
+            return self.names[i]
+        return None
+
+    def prefix(self, query: str, limit: Optional[int] = None) -> List[str]:
+        """ Return the streets whose names start with [query], in alphabetical order """
+        query = self.normalize(query)
+        if query == '':
+            return []
+        start = bisect.bisect_left(self.keys, query)
+        stop = bisect.bisect_left(self.keys, query + '\uffff', start)
+        if limit is not None:
+            stop = min(stop, start + limit)
+        return self.names[start:stop]
+
+    def substring(self, query: str, limit: Optional[int] = None) -> List[str]:
+        """ Return the streets whose names contain [query], in alphabetical order """
+        query = self.normalize(query)
+        if query == '':
+            return []
+        found = []
+        pos = self.text.find(query)
+        while pos >= 0 and (limit is None or len(found) < limit):
+            i = bisect.bisect_right(self.offsets, pos) - 1
+            found.append(self.names[i])
+            # Skip to the next key so each street is only reported once
+            pos = self.text.find(query, self.offsets[i] + len(self.keys[i]) + 1)
+        return found
+
+    def find(self, query: str) -> List[str]:
+        """ Return the exact match if there is one, else every prefix match, else every substring match """
+        street = self.exact(query)
+        if street is not None:
+            return [street]
+        return self.prefix(query) or self.substring(query)
+
+    def autocomplete(self, query: str, k: int = 10) -> List[str]:
+        """ Return the top [k] streets for [query]: the exact match, then prefix matches, then substring matches """
+        assert isinstance(k, int) and k > 0, 'k is not a positive integer'
+        results = self.prefix(query, k)
+        if len(results) < k:
+            for street in self.substring(query):
+                if street not in results:
+                    results.append(street)
+                    if len(results) >= k:
+                        break
+        return results
+
+    def get_type(self, street: str) -> str:
+        """ Return the type of a street in the index, or 'N/A' """
+        return self.types.get(self.normalize(street), 'N/A')
+
+class StreetRecord(NamedTuple):
+    """ One line of the street list, as parsed from the PDF """
+    name: str # Including the type and direction
+    type: str # Capitalized, e.g. 'St'
+    direction: str # 'n', 's', 'e', 'w' or ''
+    from_street: str
+    to_street: str
+    classification: str
+
+class StreetStore:
+    """
+    Columnar store of detailed street records. Names and ends are interned strings, while types, directions and
+    road classifications are stored as 1-byte codes into street_types, directions and road_classifications.
+    """
+    __slots__ = ('names', 'types', 'directions', 'from_streets', 'to_streets', 'classifications')
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.types = array.array('B')
+        self.directions = array.array('B')
+        self.from_streets: List[str] = []
+        self.to_streets: List[str] = []
+        self.classifications = array.array('B')
+
+    def __len__(self):
+        return len(self.names)
+
+    def clear(self) -> None:
+        self.__init__()
+
+    def append(self, record: StreetRecord) -> None:
+        self.names.append(sys.intern(record.name))
+        self.types.append(street_type_codes.get(record.type.lower(), 0))
+        self.directions.append(directions.index(record.direction) + 1 if record.direction in directions else 0)
+        self.from_streets.append(sys.intern(record.from_street))
+        self.to_streets.append(sys.intern(record.to_street))
+        self.classifications.append(road_classification_codes.get(record.classification, 0))
+
+    def get_type(self, i: int) -> str:
+        """ Return the capitalized type of record i, or '' if it has none """
+        code = self.types[i]
+        return street_types[code - 1].strip().capitalize() if code > 0 else ''
+
+    def get_direction(self, i: int) -> str:
+        code = self.directions[i]
+        return directions[code - 1] if code > 0 else ''
+
+    def get_classification(self, i: int) -> str:
+        code = self.classifications[i]
+        return road_classifications[code - 1] if code > 0 else 'N/A'
+
+    def get_record(self, i: int) -> StreetRecord:
+        return StreetRecord(self.names[i], self.get_type(i), self.get_direction(i), self.from_streets[i],
+                            self.to_streets[i], self.get_classification(i))
+
+    def get_street(self, i: int) -> Street:
+        """ Build the Street object for record i """
+        if self.to_streets[i] == self.from_streets[i]:
+            return SameFromAndToStreet(self.names[i], self.from_streets[i], self.get_classification(i))
+        return DifferentFromAndToStreet(self.names[i], self.from_streets[i], self.to_streets[i],
+                                        self.get_classification(i))
+
+    def filter(self, type: Optional[str] = None, classification: Optional[str] = None) -> List[int]:
+        """ Return the indices of the records of passed type and/or road classification """
+        type_code = None
+        classification_code = None
+        if type is not None:
+            type = type.strip().lower()
+            assert f' {type} ' in street_types, 'type is not a street type'
+            type_code = street_type_codes[type]
+        if classification is not None:
+            classification = classification.strip().title()
+            assert classification in road_classifications or classification == 'N/A', \
+                'classification is not a road classification'
+            classification_code = road_classification_codes.get(classification, 0)
+
+        indices = range(len(self.names))
+        if type_code is not None:
+            indices = [i for i in indices if self.types[i] == type_code]
+        if classification_code is not None:
+            indices = [i for i in indices if self.classifications[i] == classification_code]
+        return list(indices)
+
+street_types = [' ave ', ' bdge ', ' blvd ', ' crcl ', ' crct ', ' cres ', ' crt ', ' cs ',
+                ' dr ', ' gdns ', ' grv ', ' gt ', ' hill ', ' hts ',
+                ' lane ', ' line ', ' lwn ', ' mews ', ' path ', ' pk ',
+                ' pkwy ', ' pl ', ' ramp ', ' rd ', ' rdwy ', ' sq ',
+                ' st ', ' ter ', ' trl ', ' view ', ' walk ', ' way ',
+                ' wds ', ' wood ', ' parkway ', ' roadway '
+                ]
+directions = ['n', 's', 'e', 'w']
+
+class StreetSuffix(NamedTuple):
+    position: int # Index of the space before the suffix, as str.find(' st ') would return
+    type: str # Lowercase, without whitespaces
+    direction: str # 'n', 's', 'e', 'w' if one directly follows the suffix, else ''
+
+# Every street type and direction as a whole word, compiled once. Directions are matched as well so that a
+# single pass can tell which suffixes they follow and whether 'St' follows a type or direction (St = Saint).
+SUFFIX_PATTERN = re.compile(
+    r'(?<= )(?:(?P<type>' + '|'.join(sorted((re.escape(t.strip()) for t in street_types), key=len, reverse=True)) +
+    r')|(?P<direction>' + '|'.join(directions) + r'))(?= )', re.IGNORECASE)
+
+@profiled
+def tokenize_street_suffixes(text: str) -> List[StreetSuffix]:
+    """
+    Find the street suffixes in passed text in a single pass, in order of position. Suffixes must be surrounded by
+    spaces, as in street_types. 'St' directly after a type or direction means Saint, and 'Hill' or 'Parkway'
+    directly before a type is part of a name (Parkview Hill Cres), so neither is returned.
+    """
+    suffixes = []
+    pending = None # The last type seen, waiting to know what follows it
+    previous_end = -2
+    for match in SUFFIX_PATTERN.finditer(text):
+        adjacent = match.start() == previous_end + 1
+        previous_end = match.end()
+        type = match.group('type')
+        if type is None:
+            if pending is not None and adjacent:
+                suffixes.append(pending._replace(direction=match.group('direction').lower()))
+                pending = None
+            continue
+        type = type.lower()
+        if pending is not None and not (adjacent and pending.type in ('hill', 'parkway')):
+            suffixes.append(pending)
+        pending = None
+        if type == 'st' and adjacent:
+            continue
+        pending = StreetSuffix(match.start() - 1, type, '')
+    if pending is not None:
+        suffixes.append(pending)
+    return suffixes
+
+def split_street_name(full_name: str) -> Tuple[str, str, str]:
+    """ Split a street name into its name (with the direction, if any), its type and its direction """
+    words = full_name.split()
+    # No space before the first word: a name never starts with its type, but may start with St (Saint)
+    text = ' '.join(words) + ' '
+    suffixes = tokenize_street_suffixes(text)
+    if len(suffixes) == 0:
+        return ' '.join(words), '', ''
+    suffix = suffixes[0]
+    # Count the words before the suffix to find it in words
+    suffix_index = text[:suffix.position + 1].count(' ')
+    name = words[:suffix_index]
+    if suffix.direction != '':
+        name.append(words[suffix_index + 1])
+    return ' '.join(name), words[suffix_index], suffix.direction
+
+road_classifications = ['Major Arterial', 'Minor Arterial', 'Collector', 'Expressway', 'Local']
+COLUMN_GAP = re.compile(r' {2,}') # Separates the columns of a line extracted in layout mode
+# Codes used by StreetStore, where 0 means no type or classification
+street_type_codes = {type.strip(): i + 1 for i, type in enumerate(street_types)}
+road_classification_codes = {classification: i + 1 for i, classification in enumerate(road_classifications)}
+basic_streets: List[str] = []
+detailed_streets = StreetStore() # Parallel to basic_streets
+streets_by_type: Dict[str, List[str]] = {} # Lowercase type without whitespaces -> unique streets of that type
+street_index: Optional[StreetSearchIndex] = None
+# Distractor pools for QuizEngine: unique streets grouped by type, where the streets of each type lie in
+# distractor_streets[start:stop] for (start, stop) = distractor_ranges[type]; and the other types of each type
+distractor_streets: List[str] = []
+distractor_ranges: Dict[str, Tuple[int, int]] = {}
+distractor_types: Dict[str, List[str]] = {}
+
+PDF_PATH = 'toronto streets.pdf'
+PDF_PAGES = range(8, 47)
+SNAPSHOT_PATH = 'toronto streets.snapshot'
+SNAPSHOT_MAGIC = b'TSS1'
+SNAPSHOT_VERSION = 4
+# Magic, format version, SHA-256 of the PDF, number of records
+SNAPSHOT_HEADER = struct.Struct('<4sH32sI')
+
+def get_pdf_digest(path: str = PDF_PATH, pages: range = PDF_PAGES) -> bytes:
+    """ Return the SHA-256 digest of the PDF and the parsed page range, which keys the snapshot """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    digest.update(f'{pages.start}-{pages.stop}'.encode('ascii'))
+    return digest.digest()
+
+@profiled
+def get_basic_street_database(pages: range = PDF_PAGES, workers: Optional[int] = None) -> None:
+    """
+    Gets a list of streets found in the PDF, which only stores street names.
+    The parsed streets are cached in a snapshot keyed on the PDF's hash and the page range, so the PDF is only
+    parsed again when either changes or when the snapshot is missing.
+    """
+    try:
+        digest = get_pdf_digest(pages=pages)
+    except OSError:
+        print(f'Sorry, \'{PDF_PATH}\' cannot be found, on which this program is run.', file=sys.stderr)
+        quit()
+    if not load_snapshot(digest):
+        parse_street_database(pages, workers)
+        try:
+            save_snapshot(digest)
+        except OSError:
+            print(f'Warning: the snapshot \'{SNAPSHOT_PATH}\' could not be written.', file=sys.stderr)
+    build_street_indexes()
+
+@profiled
+def build_street_indexes() -> None:
+    """
+    Build streets_by_type, street_index and the distractor pools from basic_streets so lookups and quizzes do not
+    scan the whole list
+    """
+    global street_index
+    street_index = StreetSearchIndex(basic_streets, [detailed_streets.get_type(i) for i in range(len(basic_streets))])
+    streets_by_type.clear()
+    for type in street_types:
+        streets_by_type[type.strip()] = []
+    seen = set()
+    for i in range(len(basic_streets)):
+        street = basic_streets[i]
+        if street in seen:
+            continue
+        seen.add(street)
+        streets_by_type.setdefault(detailed_streets.get_type(i).lower(), []).append(street)
+
+    distractor_streets.clear()
+    distractor_ranges.clear()
+    distractor_types.clear()
+    for type, streets in streets_by_type.items():
+        distractor_ranges[type] = (len(distractor_streets), len(distractor_streets) + len(streets))
+        distractor_streets.extend(streets)
+        distractor_types[type] = [other.strip().capitalize() for other in street_types if other.strip() != type]
+
+@profiled
+def parse_street_database(pages: range = PDF_PAGES, workers: Optional[int] = None,
+                          report: bool = False) -> List[Tuple[int, int, float]]:
+    """
+    Parse the pages of the PDF into basic_streets and detailed_streets.
+
+    Parameters:
+        pages (range): The (0-based) pages of the PDF holding the street list
+        workers (int): The number of worker processes. None uses one per CPU, and 1 parses in this process.
+        report (bool): Whether to print how long each page took
+
+    Returns:
+        A list of (page, number of streets, seconds) for every parsed page, in page order
+    """
+    assert workers is None or (isinstance(workers, int) and workers > 0), 'workers is not a positive integer'
+    try:
+        reader = PdfReader(PDF_PATH)
+    except:
+        print(f'Sorry, \'{PDF_PATH}\' cannot be found, on which this program is run.', file=sys.stderr)
+        quit()
+    else:
+        print('Loading database...', file=sys.stderr)
+    assert 0 <= pages.start and pages.stop <= len(reader.pages), f'pages is not within 0-{len(reader.pages) - 1}'
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(min(workers, len(pages)), 1)
+
+    clear_street_database()
+    timings = []
+    if workers == 1:
+        merge_pages((parse_page(page, reader) for page in pages), timings)
+    else:
+        # Pool.imap returns the pages in the order they were submitted, which keeps basic_streets deterministic
+        with multiprocessing.Pool(workers, initializer=init_page_worker, initargs=(PDF_PATH,)) as pool:
+            merge_pages(pool.imap(parse_page, pages), timings)
+
+    if report:
+        print(f'{"Page":>6}{"Streets":>9}{"ms":>9}')
+        for page, count, seconds in timings:
+            print(f'{page:>6}{count:>9}{seconds * 1000:>9.1f}')
+        print(f'{"Total":>6}{len(basic_streets):>9}{sum(t[2] for t in timings) * 1000:>9.1f}')
+    return timings
+
+def merge_pages(results: Iterable[Tuple[int, List[StreetRecord], float]],
+                timings: List[Tuple[int, int, float]]) -> None:
+    """ Append the records of each parsed page to basic_streets and detailed_streets """
+    for page, records, seconds in results:
+        for record in records:
+            add_street_record(record)
+        timings.append((page, len(records), seconds))
+
+def add_street_record(record: StreetRecord) -> None:
+    basic_streets.append(record.name)
+    detailed_streets.append(record)
+
+def clear_street_database() -> None:
+    basic_streets.clear()
+    detailed_streets.clear()
+
+_worker_reader: Optional[PdfReader] = None
+
+def init_page_worker(path: str) -> None:
+    """ Open the PDF once in each worker process """
+    global _worker_reader
+    _worker_reader = PdfReader(path)
+
+def parse_page(page: int, reader: Optional[PdfReader] = None) -> Tuple[int, List[StreetRecord], float]:
+    """ Extract one page of the PDF and return its page number, street records and how long it took """
+    start = time.perf_counter()
+    if reader is None:
+        reader = _worker_reader
+    text: str = reader.pages[page].extract_text(extraction_mode='layout')
+    records = list(clean_street_lines(text.split('\n')))
+    return page, records, time.perf_counter() - start
+
+def clean_street_lines(lines: Iterable[str]) -> Iterator[StreetRecord]:
+    """
+    Yield a StreetRecord for each line of the PDF that contains a street. The lines are extracted in layout mode,
+    where runs of spaces separate the name, from street, to street and classification columns; a to street that
+    cannot be told apart from the from street is left empty (unknown).
+    """
+    for line in lines:
+        columns = COLUMN_GAP.split(line.strip())
+        e = ' '.join(line.split())
+        suffixes = tokenize_street_suffixes(e)
+        if len(suffixes) == 0:
+            continue
+        # The name ends at its type, unless a direction (N, S, W, E) directly follows it
+        suffix = suffixes[0]
+        name_end = suffix.position + 1 + len(suffix.type)
+        if suffix.direction != '':
+            name_end += 2
+        classification = get_classification(e)
+
+        # What is left is the from street followed by the to street, each in its own column
+        ends = e[name_end:len(e) - len(classification) if classification != 'N/A' else len(e)].strip()
+        if classification != 'N/A' and columns[-1] == classification:
+            columns.pop()
+        if len(columns) == 3:
+            from_street, to_street = columns[1], columns[2]
+        elif len(columns) == 2: # 'All, N of ...' describes both ends at once
+            from_street, to_street = columns[1], ''
+        else:
+            from_street, to_street = ends, ''
+        yield StreetRecord(e[:name_end], suffix.type.capitalize(), suffix.direction, from_street, to_street,
+                           classification)
+
+def parse_page_range(text: str) -> range:
+    """ Turn 'first-last' (inclusive, 0-based), or a single page 'N', into the range of pages to parse """
+    first, dash, last = text.partition('-')
+    if not dash:
+        last = first
+    if not first.strip().isdigit() or not last.strip().isdigit():
+        raise argparse.ArgumentTypeError(f'\'{text}\' is not a page range like 8-46')
+    if int(last) < int(first):
+        raise argparse.ArgumentTypeError(f'\'{text}\' ends before it starts')
+    return range(int(first), int(last) + 1)
+
+def parse_workers(text: str) -> int:
+    """ Turn the --workers argument into a positive number of processes """
+    if not text.strip().isdigit() or int(text) < 1:
+        raise argparse.ArgumentTypeError(f'\'{text}\' is not a positive number of workers')
+    return int(text)
+
+def parse_positive_int(text: str) -> int:
+    """ Turn an argument such as --chunk-size or --questions into a positive integer """
+    if not text.strip().isdigit() or int(text) < 1:
+        raise argparse.ArgumentTypeError(f'\'{text}\' is not a positive integer')
+    return int(text)
+
+def parse_non_negative_int(text: str) -> int:
+    """ Turn an argument such as --export-quizzes into a non-negative integer """
+    if not text.strip().isdigit():
+        raise argparse.ArgumentTypeError(f'\'{text}\' is not a non-negative integer')
+    return int(text)
+
+def get_classification(text: str) -> str:
+    """ Get the road classification at the end of a line of the PDF, or 'N/A' if the line was wrapped """
+    for classification in road_classifications:
+        if text.endswith(classification):
+            return classification
+    return 'N/A'
+
+@profiled
+def save_snapshot(digest: bytes, path: str = SNAPSHOT_PATH) -> None:
+    """
+    Write detailed_streets to a snapshot keyed on the PDF's digest. It is written to a temporary file that then
+    replaces the snapshot, so an interrupted write or several processes writing at once never leave a partial file.
+    """
+    records = '\n'.join('\t'.join(detailed_streets.get_record(i)) for i in range(len(detailed_streets)))
+    fd, temporary_path = tempfile.mkstemp(prefix='.snapshot-', dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, digest, len(basic_streets)))
+            f.write(records.encode('utf-8'))
+        # mkstemp creates the file readable by its owner only; give it the mode open() would have
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(temporary_path, 0o666 & ~umask)
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.remove(temporary_path)
+        raise
+
+def read_snapshot(path: str = SNAPSHOT_PATH) -> Optional[Tuple[bytes, List[List[str]]]]:
+    """ Read the snapshot in a single read and return its PDF digest and records, or None if it is unusable """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return None
+    if len(data) < SNAPSHOT_HEADER.size:
+        return None
+    magic, version, digest, count = SNAPSHOT_HEADER.unpack_from(data)
+    if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+        return None
+    try:
+        body = data[SNAPSHOT_HEADER.size:].decode('utf-8')
+    except UnicodeDecodeError:
+        return None
+    records = [line.split('\t') for line in body.split('\n')] if count > 0 else []
+    if len(records) != count or any(len(record) != len(StreetRecord._fields) for record in records):
+        return None
+    return digest, records
+
+@profiled
+def load_snapshot(digest: bytes, path: str = SNAPSHOT_PATH) -> bool:
+    """ Fill basic_streets from the snapshot if it was built from the PDF with the passed digest """
+    snapshot = read_snapshot(path)
+    if snapshot is None or snapshot[0] != digest:
+        return False
+    clear_street_database()
+    for record in snapshot[1]:
+        add_street_record(StreetRecord(*record))
+    return True
+
+def rebuild_snapshot(pages: range = PDF_PAGES, workers: Optional[int] = None, report: bool = False) -> None:
+    """ Parse the PDF again and overwrite the snapshot """
+    parse_street_database(pages, workers, report)
+    save_snapshot(get_pdf_digest(pages=pages))
+    print(f'Rebuilt \'{SNAPSHOT_PATH}\' with {len(basic_streets)} streets.')
+
+def verify_snapshot(pages: range = PDF_PAGES, workers: Optional[int] = None) -> bool:
+    """ Check that the snapshot matches both the PDF's hash and a fresh parse of the PDF """
+    snapshot = read_snapshot()
+    if snapshot is None:
+        print(f'\'{SNAPSHOT_PATH}\' is missing or corrupt.')
+        return False
+    if snapshot[0] != get_pdf_digest(pages=pages):
+        print(f'\'{SNAPSHOT_PATH}\' was built from a different version of \'{PDF_PATH}\' or other pages.')
+        return False
+    parse_street_database(pages, workers)
+    expected = [list(detailed_streets.get_record(i)) for i in range(len(detailed_streets))]
+    if snapshot[1] != expected:
+        print(f'\'{SNAPSHOT_PATH}\' does not match the streets parsed from \'{PDF_PATH}\'.')
+        return False
+    print(f'\'{SNAPSHOT_PATH}\' is up to date ({len(basic_streets)} streets).')
+    return True
+
+def get_street_type(text: str) -> str:
+    """ Filter other information in passed text to get the basic type of the street for completing basic_streets """
+    suffixes = tokenize_street_suffixes(text)
+    if len(suffixes) == 0:
+        return ''
+    return f' {suffixes[0].type} '
+
+def get_street_type_order(text: str) -> Tuple[int]:
+    """ Find the order of street types found in the passed text """
+    return tuple(suffix.position for suffix in tokenize_street_suffixes(text))
+
+@profiled
+def get_type (street_name: str) -> str:
+    """ Get the type of the street in basic_streets (already filtered), or 'N/A' if it is unknown or ambiguous """
+    assert isinstance(street_name, str), 'street_name is not a string'
+    if street_index is None:
+        get_basic_street_database()
+    types = {street_index.get_type(street) for street in street_index.find(street_name)}
+    if len(types) == 1:
+        return types.pop()
+    return 'N/A'
+
+def autocomplete_street (text: str, k: int = 10) -> List[str]:
+    """ Return up to [k] streets in basic_streets matching [text], best matches first """
+    assert isinstance(text, str), 'text is not a string'
+    if street_index is None:
+        get_basic_street_database()
+    return street_index.autocomplete(text, k)
+
+BATCH_FIELDS = ('name', 'street', 'type', 'status')
+
+@profiled
+def lookup_street (street_name: str) -> Tuple[str, str, str]:
+    """
+    Look up a street name and return the matched street, its type and the match status: 'exact', 'partial' (the
+    name only matched one street), 'multiple' (it matched several streets, all of the same type), 'ambiguous'
+    (it matched streets of different types, so the type is 'N/A') or 'not found'. Several matched streets are
+    joined with '|'.
+    """
+    assert isinstance(street_name, str), 'street_name is not a string'
+    if street_index is None:
+        get_basic_street_database()
+    street = street_index.exact(street_name)
+    if street is not None:
+        return street, street_index.get_type(street), 'exact'
+    matches = street_index.find(street_name)
+    if len(matches) == 0:
+        return '', 'N/A', 'not found'
+    types = {street_index.get_type(match) for match in matches}
+    if len(matches) == 1:
+        return matches[0], types.pop(), 'partial'
+    if len(types) == 1:
+        return '|'.join(matches), types.pop(), 'multiple'
+    return '|'.join(matches), 'N/A', 'ambiguous'
+
+@profiled
+def binary_search_str (element, li, min=0, max=None) -> int:
+    assert isinstance(li, list), 'li is not a list'
+    if len(li) == 0:
+        return -1
+
+    assert isinstance(min, int), f'min is not an integer'
+    if max == None:
+        max = len(li) - 1
+    else:
+        assert isinstance(max, int), f'max is not an integer'
+
+    if max >= min:
+        mid = (min + max) // 2
+        if li[mid].lower() == element.lower() or element.lower() in li[mid].lower():
+            return mid
+        elif element.lower() < li[mid].lower():
+            return binary_search_str(element, li, min, mid - 1)
+        elif element.lower() > li[mid].lower():
+            return binary_search_str(element, li, mid + 1, max)
+    else:
+        return -1
+
+@profiled
+def get_streets_of_type (type: str, amount: int = 4, shuffle: bool = False) -> List[str]:
+    """
+    Return a list of [amount] streets of passed [type].
+    When shuffle is True, the streets are sampled at random (without replacement) instead of in list order.
+    """
+    assert isinstance(type, str), 'type is not a string'
+    type = type.strip().lower()
+    assert f' {type} ' in street_types, 'type is not a street type'
+    assert isinstance(amount, int) and amount > 0, 'amount is not a positive integer'
+    if len(streets_by_type) == 0:
+        get_basic_street_database()
+    streets = streets_by_type[type]
+    if shuffle:
+        return random.sample(streets, min(amount, len(streets)))
+    return streets[:amount]
+
+def get_street_type_counts() -> Dict[str, int]:
+    """ Return how many unique streets there are of each street type """
+    if len(streets_by_type) == 0:
+        get_basic_street_database()
+    return {type: len(streets) for type, streets in streets_by_type.items()}
+
+
+QUESTION_FIELDS = ('q_type', 'street', 'street_type', 'answers', 'correct_answer', 'question')
+
+class Question:
+    """ Question in a Quiz """
+    @profiled
+    def __init__(self, q_type: str, num_of_ans: int = 0, street: str = None):
+        """
+        Generates a question based on a street.
+
+        Parameters:
+            q_type (str): The question type: either 'street' or 'type'. 'street' questions challenge users to pick the
+                correct street with a given street type, and 'type' questions challenge users to pick the correct
+                street type for a given street.
+            num_of_ans (int): The number of possible answers in the question
+            street (str): A street in basic_streets. When no arguments are passed, it is randomly
+                picked from the aforementioned list.
+        """
+        assert q_type.lower().strip() == 'street' or q_type.lower() == 'type', 'q_type is not \'street\' nor \'type\''
+        assert isinstance(num_of_ans, int) and (num_of_ans >= 2 or num_of_ans == 0), 'num_of_ans is not an integer above 2 nor it is 0'
+        if street == None:
+            street = basic_streets[random.randint(0, len(basic_streets) - 1)]
+        assert isinstance(street, str), 'street is not a string'
+        self.street = street
+        self.street_type = get_type(street)
+        self.q_type = q_type.lower().strip()
+        self.answers = set()
+        self.ordered_ans = list(self.answers)
+
+        if num_of_ans == 0:
+            return;
+
+        match self.q_type:
+            case 'street':
+                self.answers.add(self.street.title())
+                self.answers = self.answers.union(self.get_random_streets(num_of_ans - 1))
+                pass
+            case 'type':
+                self.answers.add(self.street_type.title())
+                self.answers = self.answers.union(self.get_random_types(num_of_ans - 1))
+                pass
+
+        self.ordered_ans = list(self.answers)
+
+    def get_random_types(self, n: int = 1) -> Set[str]:
+        """ Get a set of n random types that are not self.street_type """
+        assert isinstance(n, int) and n > 0, 'n is a positive integer'
+        types_set = set(street_types.copy())
+        random_types = set()
+        while len(random_types) < n:
+            item = types_set.pop()
+            if item.strip().lower() != self.street_type.strip().lower():
+                random_types.add(item.strip().lower().capitalize())
+        return random_types
+
+    def get_random_streets(self, n: int = 1) -> Set[str]:
+        """ Get a set of n random streets that are not of self.street_type """
+        assert isinstance(n, int) and n > 0, 'n is a positive integer'
+        random_streets = set()
+        types_set = set(street_types.copy())
+        while len(random_streets) < n:
+            item = types_set.pop()
+            if item.strip().lower() != self.street_type.strip().lower():
+                how_many_times = random.randint(1, n - len(random_streets))
+                random_streets = random_streets.union(get_streets_of_type(item, how_many_times, shuffle=True))
+        return random_streets
+
+    def set_answers(self, answers: List[str]) -> None:
+        """ Use passed answers, in that order, which must include the correct one """
+        assert (self.street if self.q_type == 'street' else self.street_type) in answers, 'answers has no correct answer'
+        self.answers = set(answers)
+        self.ordered_ans = list(answers)
+
+    def get_answer_len(self) -> int:
+        return len(self.ordered_ans)
+
+    def shuffle_answers(self) -> None:
+        self.ordered_ans = list(self.answers)
+
+    def render_question(self) -> str:
+        """ Renders the Question object into text and returns it """
+        string = 'QUESTION: '
+        match self.q_type:
+            case 'street':
+                if len(self.ordered_ans) > 0:
+                    string += f'Which of the following streets is of type {self.street_type}?\n'
+                    for i in range(len(self.ordered_ans)):
+                        string += f'{i + 1}. {self.remove_type_from_answer(self.ordered_ans[i])}\n'
+                else:
+                    string += f'Which street in Toronto is of type {self.street_type}?'
+            case 'type':
+                if len(self.ordered_ans) > 0:
+                    string += f'Which street type is {self.remove_type_from_answer(self.street)}?\n'
+                    for i in range(len(self.ordered_ans)):
+                        string += f'{i + 1}. {self.ordered_ans[i]}\n'
+                else:
+                    string += f'Which street type is {self.remove_type_from_answer(self.street)}?'
+        return string
+
+    def get_question_type(self):
+        return self.q_type
+
+    def get_street(self):
+        return self.street
+
+    def get_street_type(self):
+        return self.street_type
+
+    def get_correct_answer(self):
+        match self.q_type:
+            case 'street':
+                if len(self.ordered_ans) != 0:
+                    return str(self.ordered_ans.index(self.street) + 1)
+                return self.street_type
+            case 'type':
+                if len(self.ordered_ans) != 0:
+                    return str(self.ordered_ans.index(self.street_type) + 1)
+                return self.street_type
+        return None
+
+    def remove_type_from_answer (self, answer: str) -> str:
+        answer_street_type = get_type(answer).strip().lower()
+        answer = answer.lower().split(' ')
+        answer.remove(answer_street_type)
+        return ' '.join(answer)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """ Return the question as a dictionary with the keys in QUESTION_FIELDS, for exporting """
+        return {'q_type': self.q_type, 'street': self.street, 'street_type': self.street_type,
+                'answers': list(self.ordered_ans), 'correct_answer': self.get_correct_answer(),
+                'question': self.render_question()}
+
+    def __str__(self):
+        string = '**********************************************\n'
+        string += f'QUESTION:\nSTREET: {self.street}\nSTREET TYPE: {self.street_type}\n'
+        string += f'QUESTION TYPE: {self.q_type}\nANSWERS: {self.answers}\n'
+        string += '**********************************************'
+        return string
+
+class QuizEngine:
+    """
+    Generates quiz questions from a seeded random generator, drawing distractors from the pools precomputed by
+    build_street_indexes, so the same seed always gives the same questions
+    """
+    def __init__(self, seed: Optional[int] = None):
+        if len(distractor_streets) == 0:
+            get_basic_street_database()
+        self.random = random.Random(seed)
+
+    def sample_other_streets(self, type: str, n: int) -> List[str]:
+        """ Sample up to n unique streets that are not of the passed type """
+        start, stop = distractor_ranges[type.lower()]
+        available = len(distractor_streets) - (stop - start)
+        # Sample positions among the other streets, then skip over the range holding streets of this type
+        positions = self.random.sample(range(available), min(n, available))
+        return [distractor_streets[p if p < start else p + stop - start] for p in positions]
+
+    def sample_other_types(self, type: str, n: int) -> List[str]:
+        """ Sample up to n street types that are not the passed type """
+        pool = distractor_types[type.lower()]
+        return self.random.sample(pool, min(n, len(pool)))
+
+    def question(self, q_type: Optional[str] = None, num_of_ans: Optional[int] = None) -> Question:
+        """
+        Generate one question, picking the question type and number of answers at random as Quiz does when they
+        are not passed (0 answers is a free-response question)
+        """
+        assert num_of_ans is None or (isinstance(num_of_ans, int) and (num_of_ans >= 2 or num_of_ans == 0)), \
+            'num_of_ans is not an integer above 2 nor it is 0'
+        if q_type is None:
+            q_type = self.random.choice(('street', 'type'))
+        if num_of_ans is None:
+            num_of_ans = self.random.choice((0, self.random.randint(2, 6)))
+        street = distractor_streets[self.random.randrange(len(distractor_streets))]
+        question = Question(q_type, 0, street)
+        if num_of_ans == 0:
+            return question
+
+        if question.get_question_type() == 'street':
+            answers = [street] + self.sample_other_streets(question.get_street_type(), num_of_ans - 1)
+        else:
+            answers = [question.get_street_type()] + self.sample_other_types(question.get_street_type(), num_of_ans - 1)
+        self.random.shuffle(answers)
+        question.set_answers(answers)
+        return question
+
+    def questions(self, n: int) -> Iterator[Question]:
+        """ Lazily generate n questions """
+        assert isinstance(n, int) and n >= 0, 'n is not a non-negative integer'
+        for _ in range(n):
+            yield self.question()
+
+    def quizzes(self, count: int, num_of_questions: int) -> Iterator[List[Question]]:
+        """ Lazily generate [count] quizzes of [num_of_questions] questions """
+        assert isinstance(count, int) and count >= 0, 'count is not a non-negative integer'
+        assert isinstance(num_of_questions, int) and num_of_questions > 0, 'num_of_questions is not a positive integer'
+        for _ in range(count):
+            yield list(self.questions(num_of_questions))
+
+    def export_quizzes(self, output_file: TextIO, count: int, num_of_questions: int = 10, format: str = 'json') -> int:
+        """
+        Generate [count] quizzes and write them to output_file for offline use.
+
+        Parameters:
+            output_file (TextIO): Where the quizzes are written
+            count (int): The number of quizzes
+            num_of_questions (int): The number of questions in each quiz
+            format (str): 'json' (one array of quizzes), 'jsonl' (one quiz per line) or 'csv' (one question per row)
+
+        Returns:
+            The number of questions generated
+        """
+        assert format in ('json', 'jsonl', 'csv'), 'format is not \'json\', \'jsonl\' nor \'csv\''
+        start = time.perf_counter()
+        writer = None
+        if format == 'csv':
+            writer = csv.writer(output_file)
+            writer.writerow(('quiz', 'number') + QUESTION_FIELDS)
+        elif format == 'json':
+            output_file.write('[')
+
+        generated = 0
+        for i, quiz in enumerate(self.quizzes(count, num_of_questions)):
+            rows = [question.to_dict() for question in quiz]
+            generated += len(rows)
+            if writer is not None:
+                writer.writerows((i + 1, j + 1) + tuple('|'.join(row[field]) if isinstance(row[field], list)
+                                                        else row[field] for field in QUESTION_FIELDS)
+                                 for j, row in enumerate(rows))
+            elif format == 'jsonl':
+                output_file.write(json.dumps(rows) + '\n')
+            else:
+                output_file.write((',\n' if i > 0 else '\n') + json.dumps(rows))
+        if format == 'json':
+            output_file.write('\n]\n')
+
+        seconds = time.perf_counter() - start
+        print(f'Generated {count} quizzes ({generated} questions) in {seconds:.2f}s ' +
+              f'({generated / seconds if seconds > 0 else 0:,.0f} questions/s).', file=sys.stderr)
+        return generated
+
+class Quiz:
+    @profiled
+    def __init__(self, num_of_questions: int = 1, seed: Optional[int] = None):
+        assert isinstance(num_of_questions, int) and num_of_questions > 0, 'num_of_questions is not a positive integer'
+        # Free-response or multiple choice, street-type or type-type questions, picked by a QuizEngine
+        self.questions: List[Question] = list(QuizEngine(seed).questions(num_of_questions))
+        self.score = 0
+
+    def get_user_answer(self, question: Question) -> bool:
+        """ Gets the user answer and returns True if it is correct and False if not. """
+        answer = ''
+        if question.get_answer_len() == 0:
+            answer = input('ANSWER (free-response): ').strip().lower()
+            match question.get_question_type():
+                case 'street':
+                    if question.get_street_type() == get_type(answer):
+                        self.score += 1
+                        print(f'Correct! Your score is now {self.score}/{len(self.questions)}!')
+                        return True
+                    else:
+                        print(f'Incorrect! Your answer \'{answer}\' is of type \'{get_type(answer)}\'.\n' +
+                              f'Your score is now {self.score}/{len(self.questions)}. Better luck next time!')
+                        return False
+                case 'type':
+                    if question.get_correct_answer().lower() == answer.lower():
+                        self.score += 1
+                        print(f'Correct! Your score is now {self.score}/{len(self.questions)}!')
+                        return True
+                    else:
+                        print(f'Incorrect! The answer is \'{question.get_correct_answer()}\'.\n' +
+                            f'Your score is now {self.score}/{len(self.questions)}. Better luck next time!')
+                        return False
+        else:
+            answer = input('ANSWER (1/2/3/etc.): ').strip()
+            if not answer.isdigit():
+                print('INVALID ANSWER! TRY AGAIN!')
+                return self.get_user_answer(question)
+        if question.get_correct_answer().lower() == answer:
+            self.score += 1
+            print(f'Correct! Your score is now {self.score}/{len(self.questions)}!')
+            return True
+        else:
+            print(f'Incorrect! The correct answer is {question.get_correct_answer()}!\n' +
+                f'Your score is now {self.score}/{len(self.questions)}. Better luck next time!')
+            return False
+
+    def execute(self):
+        print('Let\'s begin the quiz!')
+        for i in range(len(self.questions)):
+            print(self.questions[i].render_question())
+            self.get_user_answer(self.questions[i])
+        print(f'Your final score is {self.score}/{len(self.questions)}! Thanks for playing!')
+
+    def __str__(self):
+        string = '--------------------------------------------------\n'
+        string += f'QUIZ:\n# OF QUESTIONS: {len(self.questions)}\nCURRENT SCORE: {self.score}\nQUESTIONS:\n'
+        for q in self.questions:
+            string += q.__str__() + '\n'
+        string += '--------------------------------------------------'
+        return string
+
+def input_street_name():
+    """ Look up street option """
+    while True:
+        master_input = input('Which street is it whose type you are looking for? (\'exit\' to exit to main menu) ')
+        if master_input.lower() == 'quit':
+            print('Quitting program...')
+            quit()
+        elif master_input.lower() == 'exit':
+            break
+        else:
+            street_type = get_type(master_input)
+            print(f'The street type is {street_type}.')
+            if street_type == 'N/A':
+                suggestions = autocomplete_street(master_input, 5)
+                if len(suggestions) > 0:
+                    print(f'Did you mean: {", ".join(suggestions)}?')
+
+def main_menu() -> None:
+    """ Show the main menu until the user quits """
+    while True:
+        pick_menu_option()
+
+def pick_menu_option() -> None:
+    """ Ask for one option of the main menu and carry it out """
+    master_input = ''
+    while not master_input.isdigit() or (master_input.isdigit() and (int(master_input) < 1 or int(master_input) > 4)):
+        master_input = input('What would you like to do next?\n1. Look up street\n2. Look up streets of type\n' + \
+                             '3. Quiz\n4. Quit\nANSWER (1/2/3/4): ').strip()
+        if not master_input.isdigit() or (master_input.isdigit() and (int(master_input) < 1 or int(master_input) > 4)):
+            print('INVALID INPUT. PLEASE TRY AGAIN.')
+    match int(master_input):
+        case 1:
+            input_street_name()
+        case 2:
+            type = ''
+            amount = 0
+            while True:
+                type = input('Which street type are you looking for? (\'exit\' to exit to main menu) ').strip().lower()
+                if type == 'exit':
+                    return
+                else:
+                    in_the_list = False
+                    for t in street_types:
+                        t = t.strip()
+                        if type.lower() == t.lower():
+                            in_the_list = True
+                            break
+                    if not in_the_list:
+                        print('INVALID INPUT. PLEASE TRY AGAIN.')
+                    else:
+                        break
+            while True:
+                amount = input('How many streets would you like? (\'exit\' to exit to main menu) ').strip()
+                if amount.lower() == 'exit':
+                    return
+                elif amount.isdigit() and int(amount) > 0:
+                    amount = int(amount)
+                    break
+                else:
+                    print('INVALID INPUT. PLEASE TRY AGAIN.')
+
+            # Fetch and print out the street list
+            street_list = get_streets_of_type(type, amount)
+            if len(street_list) == 0:
+                print(f'There are no streets of type \'{type}\'\n')
+            else:
+                print(f'List of Streets of Type \'{type}\':')
+                for i in range(len(street_list)):
+                    print(f'{i + 1}. {street_list[i]}')
+                print()
+            return
+        case 3:
+            quiz = None
+            while True:
+                master_input = input('How many questions would you like? (\'exit\' to exit to main menu) ').strip()
+                if master_input.lower() == 'exit':
+                    return
+                elif master_input.isdigit() and int(master_input) > 0:
+                    quiz = Quiz(int(master_input))
+                    break
+                else:
+                    print('INVALID INPUT. PLEASE TRY AGAIN.')
+            quiz.execute()
+        case 4:
+            print('Quitting program...')
+            quit()
+
+def run_batch(input_file: TextIO, output_file: TextIO, format: str = 'csv', chunk_size: int = 10000) -> int:
+    """
+    Look up every street name in input_file (one per line) and write its match to output_file.
+
+    Parameters:
+        input_file (TextIO): The street names, one per line
+        output_file (TextIO): Where the name, street, type and match status of each name is written
+        format (str): Either 'csv' or 'jsonl' (JSON Lines)
+        chunk_size (int): The number of names read, looked up and written at a time
+
+    Returns:
+        The number of names looked up
+    """
+    assert format in ('csv', 'jsonl'), 'format is not \'csv\' nor \'jsonl\''
+    assert isinstance(chunk_size, int) and chunk_size > 0, 'chunk_size is not a positive integer'
+    if street_index is None:
+        get_basic_street_database()
+    writer = None
+    if format == 'csv':
+        writer = csv.writer(output_file)
+        writer.writerow(BATCH_FIELDS)
+
+    count = 0
+    start = time.perf_counter()
+    lines = (line.rstrip('\r\n') for line in input_file)
+    while True:
+        chunk = list(itertools.islice(lines, chunk_size))
+        if len(chunk) == 0:
+            break
+        results = [(name,) + lookup_street(name) for name in chunk]
+        if writer is not None:
+            writer.writerows(results)
+        else:
+            output_file.writelines(json.dumps(dict(zip(BATCH_FIELDS, result))) + '\n' for result in results)
+        count += len(chunk)
+    seconds = time.perf_counter() - start
+    print(f'Looked up {count} names in {seconds:.2f}s ({count / seconds if seconds > 0 else 0:,.0f} names/s).',
+          file=sys.stderr)
+    return count
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Look up the street types of streets in Toronto.')
+    parser.add_argument('--rebuild-snapshot', action='store_true', help='parse the PDF again and rewrite the snapshot')
+    parser.add_argument('--verify-snapshot', action='store_true', help='check the snapshot against the PDF')
+    parser.add_argument('--pages', type=parse_page_range, default=PDF_PAGES,
+                        help='0-based pages of the PDF holding the street list, e.g. 8-46 (default)')
+    parser.add_argument('--workers', type=parse_workers, default=None,
+                        help='number of processes parsing the PDF (default: one per CPU)')
+    parser.add_argument('--timing', action='store_true',
+                        help='parse the PDF and print how long each page took, without touching the snapshot ' +
+                             '(with --rebuild-snapshot, time the rebuild instead)')
+    parser.add_argument('--batch', metavar='FILE',
+                        help='look up the street names in FILE (\'-\' for stdin) instead of showing the menu')
+    parser.add_argument('--output', metavar='FILE', default='-',
+                        help='where --batch or --export-quizzes writes its results (default: stdout)')
+    parser.add_argument('--export-quizzes', type=parse_non_negative_int, metavar='COUNT',
+                        help='write COUNT quizzes to --output instead of showing the menu')
+    parser.add_argument('--questions', type=parse_positive_int, default=10, help='questions in each quiz of --export-quizzes')
+    parser.add_argument('--seed', type=int, default=None, help='random seed of --export-quizzes')
+    parser.add_argument('--format', choices=('csv', 'jsonl', 'json'), default=None,
+                        help='output format of --batch (csv or jsonl, default csv) or --export-quizzes (default json)')
+    parser.add_argument('--chunk-size', type=parse_positive_int, default=10000, help='names --batch looks up at a time')
+    args = parser.parse_args()
+    if args.batch is not None and args.format == 'json':
+        parser.error('--batch writes csv or jsonl')
+    # Opening the PDF takes a while, so the page range is only checked when the PDF is parsed or it is not the default
+    if args.rebuild_snapshot or args.timing or args.verify_snapshot or args.pages != PDF_PAGES:
+        try:
+            page_count = len(PdfReader(PDF_PATH).pages)
+        except:
+            page_count = None
+        if page_count is not None and args.pages.stop > page_count:
+            parser.error(f'--pages must be within 0-{page_count - 1}')
+    if args.rebuild_snapshot:
+        rebuild_snapshot(args.pages, args.workers, args.timing)
+        sys.exit(0)
+    if args.timing:
+        parse_street_database(args.pages, args.workers, True)
+        sys.exit(0)
+    if args.verify_snapshot:
+        sys.exit(0 if verify_snapshot(args.pages, args.workers) else 1)
+    get_basic_street_database(args.pages, args.workers)
+    if args.export_quizzes is not None:
+        output_file = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8', newline='')
+        with output_file:
+            QuizEngine(args.seed).export_quizzes(output_file, args.export_quizzes, args.questions, args.format or 'json')
+        sys.exit(0)
+    if args.batch is not None:
+        input_file = sys.stdin if args.batch == '-' else open(args.batch, encoding='utf-8')
+        output_file = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8', newline='')
+        with input_file, output_file:
+            run_batch(input_file, output_file, args.format or 'csv', args.chunk_size)
+        sys.exit(0)
+    # print(get_type('brookmere')) # Something wrong with Brookmere Rd
+    main_menu()